@@ -4,13 +4,19 @@ from solving.solver import Solver
 from words.dictionary import Dictionary
 from words.word import Word
 from time import perf_counter
-import difflib
+from functools import lru_cache
+from itertools import islice
+from heapq import nsmallest
+from array import array
+import string
 
 APP_NAME = "WordLadder"
 MINIMUM_WORD_LENGTH = 2
 MAXIMUM_WORD_LENGTH = 15
 MINIMUM_LADDER_LENGTH = 1
 MAXIMUM_LADDER_LENGTH = 10
+SOLUTIONS_KEY = "_solutions"
+HIGHLIGHTED_LETTERS = {c: f'<span style="color: yellow; font-weight: bold;">{c}</span>' for c in string.ascii_uppercase}
 
 
 def green(msg):
@@ -21,25 +27,66 @@ def red(msg):
     return f'<span style="color: red;">{msg}</span>'
 
 
+@lru_cache(maxsize=1024)
+def norm(word_input: str) -> str:
+    return word_input.strip().upper()
+
+
+@st.cache_resource
+def get_dictionary(word_length: int) -> Dictionary:
+    return Dictionary(word_length)
+
+
+@st.cache_data(max_entries=128)
+def cached_solve(start: str, end: str, word_length: int, max_ladder_length: int):
+    dictionary = get_dictionary(word_length)
+    puzzle = Puzzle(dictionary.get(start), dictionary.get(end))
+    solver = Solver(puzzle, dictionary)
+    solutions = solver.solve(max_ladder_length)
+    # ladders are stored as indices into dictionary.words, the string table shared by every session
+    ladders = tuple(array('I', [word.index for word in solution.ladder]) for solution in solutions)
+    return ladders, solver.explored_count
+
+
+def ladder_words(dictionary, ladder):
+    words = dictionary.words
+    return [str(words[index]) for index in ladder]
+
+
+def ladder_indices(dictionary, ladder_input):
+    # words missing from the dictionary map to an index no solution can contain
+    indices = array('I')
+    for word_input in ladder_input:
+        word = dictionary.get(word_input)
+        indices.append(len(dictionary) if word is None else word.index)
+    return indices
+
+
 if "page_start" not in st.session_state:
     st.session_state.page_start = 0
 if "solutions" not in st.session_state:
     st.session_state.solutions = None
+if "solution_set" not in st.session_state:
+    st.session_state.solution_set = frozenset()
 if "user_solution" not in st.session_state:
     st.session_state.user_solution = None
 if "user_solution_input" not in st.session_state:
     st.session_state.user_solution_input = ""
 if "max_ladder_length" not in st.session_state:
     st.session_state.max_ladder_length = False
-if "button" not in st.session_state:
-    st.session_state.button = False
+if "solve_key" not in st.session_state:
+    st.session_state.solve_key = None
+if "explored_count" not in st.session_state:
+    st.session_state.explored_count = 0
+if "solve_time" not in st.session_state:
+    st.session_state.solve_time = 0.0
 
 
 def main():
     st.title(APP_NAME)
     st.markdown("Generate a word ladder from a **starting word** to an **ending word** by changing one letter at a time. 🔠")
 
-    with st.sidebar:
+    with st.sidebar.form("solve_form"):
         st.header("Settings")
         start_word_input = st.text_input("Enter start word:", value=st.session_state.get("start_word_input", ""))
         end_word_input = st.text_input("Enter end word:", value=st.session_state.get("end_word_input", ""))
@@ -48,26 +95,31 @@ def main():
             value=8, step=1
         )
         limit = st.number_input("Solutions to display at once", min_value=1, max_value=10, value=5)
+        submitted = st.form_submit_button("Solve")
     
     st.session_state["start_word_input"] = start_word_input
     st.session_state["end_word_input"] = end_word_input
 
+    dictionary_load_time = None
     if start_word_input:
         word_length = len(start_word_input)
-        if MINIMUM_WORD_LENGTH <= word_length <= MAXIMUM_WORD_LENGTH:
+        # only (re)load when the word length changes, not on every keystroke
+        if MINIMUM_WORD_LENGTH <= word_length <= MAXIMUM_WORD_LENGTH and st.session_state.get('word_length') != word_length:
+            start = perf_counter()
             with st.spinner("Loading dictionary..."):
-                dictionary = Dictionary(word_length)
-            st.session_state['dictionary'] = dictionary
-            st.session_state['dictionary_load_time'] = perf_counter()
-
-    if st.button("Solve") or st.session_state.button:
-        st.session_state.button = True
-        if 'dictionary' not in st.session_state:
+                get_dictionary(word_length)
+            st.session_state['word_length'] = word_length
+            dictionary_load_time = (perf_counter() - start) * 1000
+
+    # the search only runs on an explicit submit, other reruns (pagination, submitting a ladder) reuse its results
+    if submitted:
+        st.session_state.solutions = None
+        st.session_state.page_start = 0
+        if 'word_length' not in st.session_state:
             st.markdown(red("⚠️ Please enter a valid start word length between 2 and 15 characters."), unsafe_allow_html=True)
             return
 
-        dictionary = st.session_state['dictionary']
-        dictionary_load_time = (perf_counter() - st.session_state['dictionary_load_time']) * 1000
+        dictionary = get_dictionary(st.session_state['word_length'])
 
         start_word = validate_word(dictionary, start_word_input)
         end_word = validate_word(dictionary, end_word_input)
@@ -75,13 +127,15 @@ def main():
         if not start_word or not end_word:
             return
 
-        st.markdown(f"Took {green('%.2fms' % dictionary_load_time)} to load dictionary.", unsafe_allow_html=True)
+        # only reported on the run that actually loaded it
+        if dictionary_load_time is not None:
+            st.markdown(f"Took {green('%.2fms' % dictionary_load_time)} to load dictionary.", unsafe_allow_html=True)
 
         puzzle = Puzzle(start_word, end_word)
 
         if st.session_state.max_ladder_length == -1:
             start = perf_counter()
-            min_ladder = puzzle.calculate_minimum_ladder_length()
+            min_ladder = puzzle.calculate_minimum_ladder_length_bidi()
             took = (perf_counter() - start) * 1000
             if min_ladder is None:
                 st.markdown(red(f"Cannot solve '{start_word}' to '{end_word}' (took {took:.2f}ms to determine that)."), unsafe_allow_html=True)
@@ -89,19 +143,43 @@ def main():
             st.session_state.max_ladder_length = min_ladder
             st.markdown(f"Took {green('%.2fms' % took)} to determine minimum ladder length of {green(min_ladder)}.", unsafe_allow_html=True)
 
-        solver = Solver(puzzle)
+        solve_key = (str(start_word), str(end_word), dictionary.word_length, st.session_state.max_ladder_length)
         with st.spinner("Solving the puzzle..."):
             start = perf_counter()
-            solutions = solver.solve(st.session_state.max_ladder_length)
+            solutions, explored_count = cached_solve(*solve_key)
             took = (perf_counter() - start) * 1000
-        st.session_state.solutions = [[str(word) for word in solution.ladder] for solution in solutions]
+        st.session_state.solutions = solutions
+        st.session_state.solve_key = solve_key
+        st.session_state.solution_set = frozenset(solution.tobytes() for solution in solutions)
+        st.session_state.explored_count = explored_count
+        st.session_state.solve_time = took
+
+    if st.session_state.solutions is not None:
+        dictionary = get_dictionary(st.session_state['word_length'])
+        solutions = st.session_state.solutions
+        explored_count = st.session_state.explored_count
+        took = st.session_state.solve_time
 
         if len(solutions) == 0:
-            st.markdown(red(f"Took {took:.2f}ms to find no solutions (explored {solver.explored_count} solutions)."), unsafe_allow_html=True)
+            st.markdown(red(f"Took {took:.2f}ms to find no solutions (explored {explored_count} solutions)."), unsafe_allow_html=True)
         else:
-            # Limit the number of solutions displayed based on the 'limit' input from the settings
-            limited_solutions = st.session_state.solutions[:limit]
-            st.markdown(f"Took {green('%.2fms' % took)} to find {green(len(limited_solutions))} solutions (explored {green(solver.explored_count)} solutions).", unsafe_allow_html=True)
+            st.markdown(f"Took {green('%.2fms' % took)} to find {green(len(solutions))} solutions (explored {green(explored_count)} solutions).", unsafe_allow_html=True)
+
+            # Page through the solutions, showing 'limit' of them at a time as set in the settings
+            # page starts stay multiples of 'limit' so Previous and Next always land on the same pages
+            last_page_start = ((len(solutions) - 1) // limit) * limit
+            previous_column, next_column = st.columns(2)
+            if previous_column.button("Previous"):
+                st.session_state.page_start = max(0, st.session_state.page_start - limit)
+            if next_column.button("Next"):
+                st.session_state.page_start = min(st.session_state.page_start + limit, last_page_start)
+            st.session_state.page_start = min(st.session_state.page_start // limit * limit, last_page_start)
+            page_start = st.session_state.page_start
+
+            html_blocks = []
+            for solution in islice(solutions, page_start, page_start + limit):
+                html_blocks.append(highlight_changes_in_ladder(ladder_words(dictionary, solution)))
+            st.markdown("<br>".join(html_blocks), unsafe_allow_html=True)
 
 
         user_solution_input = st.text_area("Enter your word ladder solution (comma separated):", st.session_state.user_solution_input)
@@ -110,25 +188,30 @@ def main():
         if st.button("Submit Solution"):
             
             if st.session_state.user_solution_input:
-                user_solution_list = [word.strip().upper() for word in st.session_state.user_solution_input.split(",")]
+                user_solution_list = tuple(norm(word) for word in st.session_state.user_solution_input.split(","))
                 # st.write(f"User's solution (cleaned): {user_solution_list}")
 
                 st.session_state.user_solution = user_solution_list
+                user_ladder = ladder_indices(dictionary, user_solution_list)
 
-                if any([user_solution_list == solution for solution in limited_solutions]):
+                if user_ladder.tobytes() in st.session_state.solution_set:
                     st.success("Congratulations! Your solution is correct.")
                 else:
-                    st.error("Your solution is incorrect. Here are the closest solutions:")
-                    closest_solutions = find_closest_solutions(user_solution_list, limited_solutions)
+                    closest_solutions = find_closest_solutions(user_ladder, st.session_state.solutions,
+                                                               st.session_state.solve_key, limit)
+                    if closest_solutions:
+                        st.error("Your solution is incorrect. Here are the closest solutions:")
+                    else:
+                        st.error("Your solution is incorrect and no solution is close to it.")
                     for solution in closest_solutions:
-                        st.markdown(" ➔ ".join(solution), unsafe_allow_html=True)
+                        st.markdown(" ➔ ".join(ladder_words(dictionary, solution)), unsafe_allow_html=True)
             else:
                 st.write("⚠️ Please enter a word ladder solution before submitting.")
 
 
 
 def validate_word(dictionary, word_input):
-    word = dictionary.get(word_input.upper())
+    word = dictionary.get(norm(word_input))
     if word is None:
         st.markdown(red(f"⚠️ Word '{word_input}' does not exist!"), unsafe_allow_html=True)
     elif word.is_island:
@@ -138,45 +221,78 @@ def validate_word(dictionary, word_input):
     return None
 
 
-def find_closest_solutions(user_solution, solutions):
-    
-    solutions_with_ratio = [
-        (solution, difflib.SequenceMatcher(None, user_solution, solution).ratio())
-        for solution in solutions
-    ]
-    
-    solutions_with_ratio.sort(key=lambda x: x[1], reverse=True)
-    
-    
-    closest_solutions = [solution for solution, ratio in solutions_with_ratio]
-    
-    return closest_solutions
+@st.cache_resource(max_entries=16)
+def build_solution_trie(start: str, end: str, word_length: int, max_ladder_length: int, _solutions):
+    # keyed on the cached_solve inputs that produced _solutions, so the ladders themselves are never hashed.
+    # each node maps a ladder word to its child node, ladders ending at a node are listed under SOLUTIONS_KEY
+    root = {}
+    for index, solution in enumerate(_solutions):
+        node = root
+        for word in solution:
+            node = node.setdefault(word, {})
+        node.setdefault(SOLUTIONS_KEY, []).append(index)
+    return root
+
+
+def find_closest_solutions(user_solution, solutions, solve_key, limit, max_cost=None):
+    if max_cost is None:
+        max_cost = (len(user_solution) + 1) // 2
+    trie = build_solution_trie(*solve_key, solutions)
+    first_row = list(range(len(user_solution) + 1))
+    results = []
+    for word, child in trie.items():
+        _search_solution_trie(child, word, user_solution, first_row, results, max_cost)
+    return [solutions[index] for _, index in nsmallest(limit, results)]
+
+
+def _search_solution_trie(node, word, user_solution, previous_row, results, max_cost):
+    # one row of the word-level edit distance table per trie level, so shared ladder prefixes are only computed once
+    current_row = [previous_row[0] + 1]
+    for column in range(1, len(user_solution) + 1):
+        insert_cost = current_row[column - 1] + 1
+        delete_cost = previous_row[column] + 1
+        replace_cost = previous_row[column - 1] + (user_solution[column - 1] != word)
+        current_row.append(min(insert_cost, delete_cost, replace_cost))
+
+    if current_row[-1] <= max_cost:
+        for index in node.get(SOLUTIONS_KEY, ()):
+            results.append((current_row[-1], index))
+
+    if min(current_row) <= max_cost:
+        for next_word, child in node.items():
+            if next_word != SOLUTIONS_KEY:
+                _search_solution_trie(child, next_word, user_solution, current_row, results, max_cost)
+
+
+def changed_letter_index(word, other_word):
+    # index of the first letter that differs, found from the highest set bit of the XOR of both words' bytes
+    changed = int.from_bytes(word.encode('ascii'), 'big') ^ int.from_bytes(other_word.encode('ascii'), 'big')
+    if changed == 0:
+        return -1
+    return len(word) - 1 - (changed.bit_length() - 1) // 8
 
 
 def highlight_changes_in_ladder(ladder):
-    highlighted_ladder = []
+    parts = []
+    append = parts.append
     
     for i in range(len(ladder) - 1):
         word1 = ladder[i]
         word2 = ladder[i + 1]
         
-        
-        for j in range(len(word1)):
-            if word1[j] != word2[j]:
-                
-                highlighted_word = (
-                    word1[:j] + 
-                    f'<span style="color: yellow; font-weight: bold;">{word1[j]}</span>' + 
-                    word1[j+1:]
-                )
-                highlighted_ladder.append(highlighted_word)
-                break
-        highlighted_ladder.append(" ➔ ")  
+        j = changed_letter_index(word1, word2)
+        if j >= 0:
+            append(word1[:j])
+            append(HIGHLIGHTED_LETTERS[word1[j]])
+            append(word1[j+1:])
+        else:
+            append(word1)
+        append(" ➔ ")
 
     
-    highlighted_ladder.append(ladder[-1])
+    append(ladder[-1])
     
-    return "".join(highlighted_ladder)
+    return "".join(parts)
 
 
 if __name__ == "__main__":
@@ -16,12 +16,37 @@ class Puzzle(object):
         elif diffs == 2:
             common = set()
             for word in start.linked_words:
-                common.add(str(word))
+                common.add(word.code)
             for word in end.linked_words:
-                if str(word) in common:
+                if word.code in common:
                     return 3
         if len(start.linked_words) > len(end.linked_words):
             start = self.end_word
             end = self.start_word
         return WordDistanceMap(start)[end]
 
+    def calculate_minimum_ladder_length_bidi(self):
+        if self.start_word - self.end_word == 0:
+            return 1
+        frontier = [self.start_word]
+        other_frontier = [self.end_word]
+        seen = {self.start_word.code}
+        other_seen = {self.end_word.code}
+        links = 0
+        while len(frontier) > 0 and len(other_frontier) > 0:
+            # always expand the smaller frontier
+            if len(frontier) > len(other_frontier):
+                frontier, other_frontier = other_frontier, frontier
+                seen, other_seen = other_seen, seen
+            links += 1
+            next_frontier = []
+            for word in frontier:
+                for linked_word in word.linked_words:
+                    linked = linked_word.code
+                    if linked in other_seen:
+                        return links + 1
+                    if linked not in seen:
+                        seen.add(linked)
+                        next_frontier.append(linked_word)
+            frontier = next_frontier
+        return None
@@ -42,16 +42,16 @@ class CandidateSolution(object):
             self.ladder.append(word)
         self.seen_words = set()
         for word in self.ladder:
-            self.seen_words.add(str(word))
+            self.seen_words.add(word.code)
 
     def seen(self, word: Word) -> bool:
-        return str(word) in self.seen_words
+        return word.code in self.seen_words
 
     def spawn(self, next_word: Word) -> CandidateSolution:
         result = CandidateSolution(*self.ladder)
         for s in self.seen_words:
             result.seen_words.add(s)
-        result.seen_words.add(str(next_word))
+        result.seen_words.add(next_word.code)
         result.ladder.append(next_word)
         return result
 
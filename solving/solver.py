@@ -1,12 +1,14 @@
 from solving.puzzle import Puzzle
 from solving.solution import Solution, CandidateSolution
-from solving.word_distance_map import WordDistanceMap
+from solving.word_distance_map import WordDistanceMap, CompiledWordDistanceMap
+from words.dictionary import Dictionary
 from words.word import Word
 
 
 class Solver(object):
-    def __init__(self, puzzle: Puzzle):
+    def __init__(self, puzzle: Puzzle, dictionary: Dictionary = None):
         self.puzzle: Puzzle = puzzle
+        self.adjacency = dictionary.adjacency if dictionary is not None else None
         self.start_word: Word = puzzle.start_word
         self.end_word: Word = puzzle.end_word
         self.explored_count: int = 0
@@ -43,7 +45,10 @@ class Solver(object):
             self.start_word = self.puzzle.end_word
             self.end_word = self.puzzle.start_word
 
-        self.end_distances = WordDistanceMap(self.end_word, self.maximum_ladder_length - 1)
+        if self.adjacency is not None:
+            self.end_distances = CompiledWordDistanceMap(self.end_word, self.adjacency, self.maximum_ladder_length - 1)
+        else:
+            self.end_distances = WordDistanceMap(self.end_word, self.maximum_ladder_length - 1)
         for linked_word in self.start_word.linked_words:
             if self.end_distances.reachable(linked_word, self.maximum_ladder_length):
                 self._solve(CandidateSolution(self.start_word, linked_word))
@@ -62,9 +67,9 @@ class Solver(object):
                     self._solve(candidate.spawn(linked_word))
 
     def _short_circuit_ladder_length_3(self):
-        common: set[str] = set()
+        common: set[int] = set()
         for word in self.start_word.linked_words:
-            common.add(str(word))
+            common.add(word.code)
         for word in self.end_word.linked_words:
-            if str(word) in common:
+            if word.code in common:
                 self.solutions.append(Solution(self.start_word, word, self.end_word))
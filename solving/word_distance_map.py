@@ -1,16 +1,20 @@
 from collections import deque
+
+import numpy as np
+from numba import njit
+
 from words.word import Word
 
 
 class WordDistanceMap(object):
     def __init__(self, word: Word, maximum_ladder_length: int = None):
-        self.distances = {str(word): 1}
+        self.distances = {word.code: 1}
         queue = deque()
         queue.append(word)
         max_distance = maximum_ladder_length if maximum_ladder_length is not None else 255
         while len(queue) > 0:
             next_word: Word = queue.popleft()
-            distance = self.distances.get(str(next_word))
+            distance = self.distances.get(next_word.code)
             if distance is None:
                 distance = 0
             distance = distance + 1
@@ -18,19 +22,66 @@ class WordDistanceMap(object):
                 for linked_word in next_word.linked_words:
                     if linked_word not in self:
                         queue.append(linked_word)
-                        self.distances[str(linked_word)] = distance
+                        self.distances[linked_word.code] = distance
 
     def __len__(self):
         return len(self.distances)
 
     def __contains__(self, word: Word):
-        return str(word) in self.distances
+        return word.code in self.distances
 
     def __getitem__(self, word: Word):
-        return self.distances.get(str(word))
+        return self.distances.get(word.code)
 
     def reachable(self, word: Word, maximum_ladder_length: int):
-        distance = self.distances.get(str(word))
+        distance = self.distances.get(word.code)
         if distance is None:
             return False
         return distance <= maximum_ladder_length
+
+
+@njit(cache=True)
+def _bfs(offsets, neighbours, source, max_distance):
+    # same distances as WordDistanceMap, indexed by Word.index, with 0 meaning unreachable
+    distances = np.zeros(len(offsets) - 1, dtype=np.uint8)
+    queue = np.empty(len(offsets) - 1, dtype=np.int32)
+    distances[source] = 1
+    queue[0] = source
+    head = 0
+    tail = 1
+    while head < tail:
+        current = queue[head]
+        head += 1
+        distance = distances[current] + 1
+        if distance > max_distance:
+            break
+        for k in range(offsets[current], offsets[current + 1]):
+            linked = neighbours[k]
+            if distances[linked] == 0:
+                distances[linked] = distance
+                queue[tail] = linked
+                tail += 1
+    return distances
+
+
+class CompiledWordDistanceMap(object):
+    def __init__(self, word: Word, adjacency, maximum_ladder_length: int = None):
+        offsets, neighbours = adjacency
+        max_distance = maximum_ladder_length if maximum_ladder_length is not None else 255
+        self.distances = _bfs(offsets, neighbours, word.index, max_distance)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.distances))
+
+    def __contains__(self, word: Word):
+        return self.distances[word.index] != 0
+
+    def __getitem__(self, word: Word):
+        distance = self.distances[word.index]
+        if distance == 0:
+            return None
+        return int(distance)
+
+    def reachable(self, word: Word, maximum_ladder_length: int):
+        distance = self.distances[word.index]
+        return distance != 0 and distance <= maximum_ladder_length
@@ -0,0 +1,29 @@
+from streamlit.testing.v1 import AppTest
+
+
+def solve(start_word, end_word, max_ladder_length):
+    at = AppTest.from_file("../app.py", default_timeout=60).run()
+    at.sidebar.text_input[0].set_value(start_word)
+    at.sidebar.text_input[1].set_value(end_word)
+    at.sidebar.number_input[0].set_value(max_ladder_length)
+    at.sidebar.button[0].click().run()
+    return at
+
+
+def submit(at, ladder):
+    at.text_area[0].set_value(ladder)
+    next(button for button in at.button if button.label == "Submit Solution").click().run()
+    return at
+
+
+def test_correct_ladder_is_accepted():
+    at = submit(solve("cat", "dog", 4), "cat, cot, cog, dog")
+    assert not at.exception
+    assert [success.value for success in at.success] == ["Congratulations! Your solution is correct."]
+
+
+def test_incorrect_ladder_lists_closest_solutions():
+    at = submit(solve("cat", "dog", 4), "cat, cot, dog")
+    assert not at.exception
+    assert [error.value for error in at.error] == ["Your solution is incorrect. Here are the closest solutions:"]
+    assert "CAT ➔ COT ➔ COG ➔ DOG" in [markdown.value for markdown in at.markdown]
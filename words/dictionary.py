@@ -1,5 +1,7 @@
 import os.path as path
 
+import numpy as np
+
 from words.word import Word
 
 FILE_PREFIX = "/resources/dictionary-"
@@ -12,11 +14,13 @@ class Dictionary(object):
     def __init__(self, word_length):
         self.__word_length = word_length
         if word_length in Dictionary.__dictionary_cache:
-            self.__words = Dictionary.__dictionary_cache[word_length]
+            self.__lookup, self.__words, self.__adjacency = Dictionary.__dictionary_cache[word_length]
         else:
-            self.__words = {}
+            self.__lookup = {}
+            self.__words = []
             self.__load()
-            Dictionary.__dictionary_cache[word_length] = self.__words
+            self.__adjacency = self.__build_adjacency()
+            Dictionary.__dictionary_cache[word_length] = (self.__lookup, self.__words, self.__adjacency)
 
     def __load(self):
         filename = path.dirname(path.abspath(__file__)) + FILE_PREFIX + str(self.__word_length) + FILE_SUFFIX
@@ -24,7 +28,8 @@ class Dictionary(object):
         with open(filename, 'r') as f:
             for line in f.readlines():
                 word = Word(line.strip())
-                self.__words[str(word)] = word
+                if not self.__insert(word):
+                    continue
                 for variant in word.variations:
                     existing = links_builder.get(variant)
                     if existing is None:
@@ -35,17 +40,48 @@ class Dictionary(object):
                         word.add_link(linkedWord)
                     existing.append(word)
 
+    def __insert(self, word: Word) -> bool:
+        # duplicate lines keep the first Word, so every Word reachable from the lookup has a valid index
+        if str(word) in self.__lookup:
+            return False
+        word.index = len(self.__words)
+        self.__words.append(word)
+        self.__lookup[str(word)] = word
+        return True
+
+    def __build_adjacency(self):
+        # compressed sparse rows: the links of word i are neighbours[offsets[i]:offsets[i + 1]]
+        offsets = np.zeros(len(self.__words) + 1, dtype=np.int32)
+        for word in self.__words:
+            offsets[word.index + 1] = len(word.linked_words)
+        np.cumsum(offsets, out=offsets)
+        neighbours = np.fromiter((linked_word.index for word in self.__words for linked_word in word.linked_words),
+                                 dtype=np.int32, count=offsets[-1])
+        return offsets, neighbours
+
     @property
     def word_length(self):
         return self.__word_length
 
+    @property
+    def words(self) -> list[Word]:
+        return self.__words
+
+    @property
+    def adjacency(self):
+        return self.__adjacency
+
     def __len__(self):
         return len(self.__words)
 
     def __getitem__(self, word: str):
         if not isinstance(word, str):
             return None
-        return self.__words.get(word.upper())
+        # keys are stored upper case, so already normalised input needs no upper() copy
+        found = self.__lookup.get(word)
+        if found is None:
+            found = self.__lookup.get(word.upper())
+        return found
 
     def get(self, word: str):
         return self.__getitem__(word)
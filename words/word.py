@@ -1,17 +1,16 @@
 class Word(object):
-    __slots__ = ['actual_word', 'linked_words']
+    __slots__ = ['actual_word', 'linked_words', 'code', 'index']
     def __init__(self, actual_word: str):
         self.actual_word = actual_word.upper()
         self.linked_words = []
+        self.index = -1
+        # 5 bits per letter, A = 1, so no letter encodes to 0 and words of different lengths never share a code
+        self.code = sum((ord(c) - 64) << (5 * i) for i, c in enumerate(self.actual_word))
 
     @property
     def variations(self):
-        vs: list[str] = []
-        for i in range(len(self.actual_word)):
-            letters = list(self.actual_word)
-            letters[i] = '_'
-            vs.append(''.join(letters))
-        return vs
+        word = self.actual_word
+        return [word[:i] + '_' + word[i + 1:] for i in range(len(word))]
 
     def add_link(self, linked_word):
         self.linked_words.append(linked_word)
@@ -24,9 +23,11 @@ class Word(object):
         if not isinstance(other, Word):
             return None
         diffs = 0
-        for i in range(len(self.actual_word)):
-            if self.actual_word[i:i + 1] != other.actual_word[i:i + 1]:
+        changed = self.code ^ other.code
+        while changed:
+            if changed & 0x1F:
                 diffs += 1
+            changed >>= 5
         return diffs
 
     def __str__(self):